@@ -1,13 +1,16 @@
 """AppLog - Job Application Tracker"""
 
+import asyncio
+import re
+
 import reflex as rx
 
 # Typing imports
-from typing import List, Dict, Generator
+from typing import List, Dict
 
 # DB-related imports
-from applog.database import SessionLocal, init_db
-from applog.models.job_application import JobApplication
+from applog.database import session_scope, init_db
+from applog.models.job_application import JobApplication, ApplicationStatus
 
 # Datetime
 from datetime import datetime
@@ -21,11 +24,15 @@ from applog.components.main import index_page
 from applog.services.job_service import (
     create_job,
     add_note,
-    delete_job
+    delete_job,
+    get_all_jobs,
+    get_job_by_id,
+    update_job,
 )
 from applog.services.template_service import (
     create_template,
     get_all_templates,
+    get_templates_generation,
     update_template,
     delete_template,
 )
@@ -34,6 +41,35 @@ from applog.components.jobs import (
     add_job,
 )
 
+# Filter sentinels: the "no filter" entry at the top of each dropdown
+_ALL_COMPANIES = "All Companies"
+_ALL_STATUSES = "All Statuses"
+_ALL_LOCATIONS = "All Locations"
+
+# Statuses hidden from the main list unless explicitly selected in the filter
+_EXCLUDED_STATUSES = frozenset({"Rejected", "Withdrawn", "No Response"})
+
+# Job URLs must be absolute http(s) links; compiled once at import
+_URL_RE = re.compile(r"^https?://[^\s]+$", re.IGNORECASE)
+
+# Notes rendered per step on the job detail page ("Show older notes" adds another page)
+_NOTES_PAGE_SIZE = 20
+
+# Job cards rendered per page of the index job list
+_JOBS_PAGE_SIZE = 100
+
+# Templates rendered per step in the template lists ("Show more templates" adds another page)
+_TEMPLATES_PAGE_SIZE = 50
+
+# Cache key of _filtered_jobs and the vars derived from it: the filter inputs plus the jobs version
+_FILTERED_JOBS_DEPS = [
+    "search_query",
+    "selected_company",
+    "selected_status",
+    "selected_location",
+    "_jobs_version",
+]
+
 class State(rx.State):
     """The app state."""
 
@@ -41,12 +77,34 @@ class State(rx.State):
 
     # Search and filter state
     search_query: str = ""
-    selected_company: str = "All Companies"
-    selected_status: str = "All Statuses"
-    selected_location: str = "All Locations"
+    selected_company: str = _ALL_COMPANIES
+    selected_status: str = _ALL_STATUSES
+    selected_location: str = _ALL_LOCATIONS
+    jobs_page: int = 0  # Zero-based page of _filtered_jobs shown in the job list
+
+    # Backend-only: job data (loaded from database); the UI reads the derived vars, never the table
+    _jobs: List[Dict] = []
+
+    # Backend-only: bumped whenever self._jobs changes, keys the _filtered_jobs cache
+    _jobs_version: int = 0
 
-    # Job data (loaded from database)
-    jobs: List[Dict] = []
+    # Backend-only: id -> job dict (same objects as in self._jobs) for O(1) lookups
+    _jobs_by_id: Dict[int, Dict] = {}
+
+    # Backend-only: one column per filtered field, aligned with self._jobs by index
+    _col_company: List[str] = []
+    _col_status: List[str] = []
+    _col_location: List[str] = []
+    _col_search: List[str] = []  # casefolded "company\ntitle", one substring test per job
+
+    # Backend-only: jobs not in _EXCLUDED_STATUSES, i.e. the default unfiltered view
+    _active_jobs: List[Dict] = []
+
+    # Job count and sorted filter dropdown values, set by _rebuild_job_columns when jobs change
+    total_jobs_count: int = 0
+    unique_companies: List[str] = [_ALL_COMPANIES]
+    unique_statuses: List[str] = [_ALL_STATUSES]
+    unique_locations: List[str] = [_ALL_LOCATIONS]
 
     # Add job form state
     form_company_name: str = ""
@@ -64,10 +122,13 @@ class State(rx.State):
     new_note_text: str = ""
     detail_status: str = ""  # For status update in detail page
     status_edit_mode: bool = False  # Toggle edit mode for status
+    notes_visible_count: int = _NOTES_PAGE_SIZE  # Newest notes rendered in Note History
+    add_note_open: bool = False  # Add Note form is only rendered once opened
 
     # Message state for user feedback
     form_message: str = ""
     form_message_type: str = ""  # "success" or "error"
+    _form_message_seq: int = 0  # Backend-only: bumped per message, so a delayed clear only hits its own message
 
     # Confirmation dialog for deletion operation
     show_delete_dialog: bool = False
@@ -77,7 +138,13 @@ class State(rx.State):
 
     # Template management state
     templates: List[Dict] = []
+    _templates_by_id: Dict[int, Dict] = {}
+    _templates_generation: int = -1  # Backend-only: template service generation of the loaded templates
+
+    # Backend-only: lowercased "name\x1fcontent" search column, aligned with self.templates by index
+    _col_template_search: List[str] = []
     template_search_query: str = ""
+    templates_visible_count: int = _TEMPLATES_PAGE_SIZE  # Filtered templates rendered in the lists
     selected_template_id: int = 0
 
     # Template form state
@@ -88,103 +155,175 @@ class State(rx.State):
     show_delete_template_dialog: bool = False
 
     # COMPUTED PROPERTIES (@rx.var)
+    @rx.var(cache=True, auto_deps=False, deps=_FILTERED_JOBS_DEPS)
+    def _filtered_jobs(self) -> List[Dict]:
+        """Filter jobs based on search and filters (single pass over the jobs).
+
+        Backend-only: the full list never goes to the browser, only its current page (paged_jobs).
+
+        Only recomputed when the search/filter values or the jobs version change,
+        so unrelated state updates (dialogs, form fields) reuse the cached list.
+        """
+        query = self.search_query.casefold() if self.search_query else None
+        company = self.selected_company
+        status = self.selected_status
+        location = self.selected_location
+
+        # Fast path: default "browse" view, precomputed when jobs are (re)indexed
+        if (
+            query is None
+            and company == _ALL_COMPANIES
+            and status == _ALL_STATUSES
+            and location == _ALL_LOCATIONS
+        ):
+            return self._active_jobs
+
+        jobs = self._jobs
+        col_company = self._col_company
+        col_status = self._col_status
+        col_location = self._col_location
+        col_search = self._col_search
+
+        return [
+            jobs[i]
+            for i in range(len(col_company))
+            # Cheap equality checks first, the substring search last
+            if (
+                # "All Statuses" hides inactive applications by default
+                col_status[i] not in _EXCLUDED_STATUSES
+                if status == _ALL_STATUSES
+                else col_status[i] == status
+            )
+            and (company == _ALL_COMPANIES or col_company[i] == company)
+            and (location == _ALL_LOCATIONS or col_location[i] == location)
+            and (query is None or query in col_search[i])
+        ]
+
+    @rx.var(cache=True, auto_deps=False, deps=_FILTERED_JOBS_DEPS)
+    def filtered_jobs_count(self) -> int:
+        """Get total number of filtered job applications.
+
+        Shares the _filtered_jobs cache key, so the length is computed once per key
+        from the already-cached list and never triggers a second filter pass.
+        """
+        return len(self._filtered_jobs)
+
+    @rx.var(cache=True, auto_deps=False, deps=_FILTERED_JOBS_DEPS)
+    def jobs_page_count(self) -> int:
+        """Get the number of job list pages (at least 1, so an empty list still has a page)."""
+        return max(1, -(-len(self._filtered_jobs) // _JOBS_PAGE_SIZE))
+
     @rx.var
-    def total_jobs_count(self) -> int:
-        """Get total number of job applications."""
-        return len(self.jobs)
+    def current_jobs_page(self) -> int:
+        """Get the zero-based page being shown, clamped to the last page.
+
+        Filter changes reset jobs_page, but a reload can still shrink _filtered_jobs
+        below it; clamping keeps the list on the last non-empty page.
+        """
+        return min(self.jobs_page, self.jobs_page_count - 1)
+
+    @rx.var(cache=True, auto_deps=False, deps=[*_FILTERED_JOBS_DEPS, "jobs_page"])
+    def paged_jobs(self) -> List[Dict]:
+        """Get the filtered jobs on the current page, the only ones rendered in the job list."""
+        start = self.current_jobs_page * _JOBS_PAGE_SIZE
+        return self._filtered_jobs[start:start + _JOBS_PAGE_SIZE]
 
     @rx.var
-    def filtered_jobs(self) -> List[Dict]:
-        """Filter jobs based on search and filters."""
-        result = self.jobs
-
-        # Apply search filter
-        if self.search_query:
-            result = [
-                job
-                for job in result
-                if self.search_query.lower() in job["company_name"].lower()
-                or self.search_query.lower() in job["job_title"].lower()
-            ]
-
-        # Apply company filter
-        if self.selected_company != "All Companies":
-            result = [
-                job for job in result if job["company_name"] == self.selected_company
-            ]
-
-        # Apply status filter
-        if self.selected_status == "All Statuses":
-            result = [job for job in result if job["status"] not in ["Rejected", "Withdrawn", "No Response"]]
-        elif self.selected_status != "All Statuses":
-            result = [job for job in result if job["status"] == self.selected_status]
-
-        # Apply location filter
-        if self.selected_location != "All Locations":
-            result = [
-                job for job in result if job["location"] == self.selected_location
-            ]
-
-        return result
+    def has_prev_jobs_page(self) -> bool:
+        """Whether a previous job list page exists."""
+        return self.current_jobs_page > 0
 
     @rx.var
-    def filtered_jobs_count(self) -> int:
-        """Get total number of filtered job applications."""
-        return len(self.filtered_jobs)
+    def has_next_jobs_page(self) -> bool:
+        """Whether a next job list page exists."""
+        return self.current_jobs_page < self.jobs_page_count - 1
 
     @rx.var
-    def unique_companies(self) -> List[str]:
-        """Get unique company names."""
+    def _selected_job(self) -> Dict | None:
+        """Get the currently selected job for detail view (backend-only: the UI reads the selected_job_* vars)."""
+        return self._jobs_by_id.get(self.selected_job_id)
 
-        return ["All Companies"] + sorted(
-            list(set(job["company_name"] for job in self.jobs))
-        )
+    @rx.var
+    def has_selected_job(self) -> bool:
+        """Whether the detail page's job exists (branch flag for the "Job not found" view)."""
+        return self.selected_job_id in self._jobs_by_id
 
     @rx.var
-    def unique_statuses(self) -> List[str]:
-        """Get unique statuses."""
+    def selected_job_notes(self) -> List[Dict]:
+        """Get notes for the selected job with proper type annotation for foreach.
 
-        return ["All Statuses"] + sorted(list(set(job["status"] for job in self.jobs)))
+        Notes are stored newest first by _job_to_dict, so no reordering is needed here.
+        """
+        job = self._selected_job
+        return job["notes"] if job else []
 
     @rx.var
-    def unique_locations(self) -> List[str]:
-        """Get unique locations."""
+    def visible_notes(self) -> List[Dict]:
+        """Get the newest notes_visible_count notes, the only ones rendered in Note History."""
+        return self.selected_job_notes[:self.notes_visible_count]
 
-        return ["All Locations"] + sorted(
-            list(set(job["location"] for job in self.jobs))
-        )
+    @rx.var
+    def has_more_notes(self) -> bool:
+        """Whether older notes are hidden beyond the visible window."""
+        return len(self.selected_job_notes) > self.notes_visible_count
 
     @rx.var
-    def selected_job(self) -> Dict | None:
-        """Get the currently selected job for detail view."""
+    def selected_job_application_date_formatted(self) -> str:
+        """Get formatted application date for selected job."""
 
-        for job in self.jobs:
+        if self._selected_job and self._selected_job.get("application_date_formatted"):
 
-            if job.get("id") == self.selected_job_id:
-                return job
+            return self._selected_job["application_date_formatted"]
 
-        return None
+        return "No date set"
 
     @rx.var
-    def selected_job_notes(self) -> List[Dict]:
-        """Get notes for the selected job with proper type annotation for foreach."""
+    def selected_job_has_salary(self) -> bool:
+        """Whether the selected job has a salary range to show."""
+        job = self._selected_job
+        return bool(job and job["has_salary"])
 
-        if self.selected_job and self.selected_job.get("notes"):
+    @rx.var
+    def selected_job_has_url(self) -> bool:
+        """Whether the selected job has a job URL to show."""
+        job = self._selected_job
+        return bool(job and job["job_url"])
 
-            # Return in reverse chronological order (newest first)
-            return list(reversed(self.selected_job["notes"]))
+    @rx.var
+    def selected_job_company_name(self) -> str:
+        """Get the selected job's company name (empty if no job is selected)."""
+        job = self._selected_job
+        return (job["company_name"] or "") if job else ""
 
-        return []
+    @rx.var
+    def selected_job_title(self) -> str:
+        """Get the selected job's job title (empty if no job is selected)."""
+        job = self._selected_job
+        return (job["job_title"] or "") if job else ""
 
     @rx.var
-    def selected_job_application_date_formatted(self) -> str:
-        """Get formatted application date for selected job."""
+    def selected_job_status(self) -> str:
+        """Get the selected job's status (empty if no job is selected)."""
+        job = self._selected_job
+        return (job["status"] or "") if job else ""
 
-        if self.selected_job and self.selected_job.get("application_date"):
+    @rx.var
+    def selected_job_location(self) -> str:
+        """Get the selected job's location (empty if no job is selected)."""
+        job = self._selected_job
+        return (job["location"] or "") if job else ""
 
-            return formatters.format_date(self.selected_job["application_date"])
+    @rx.var
+    def selected_job_salary(self) -> str:
+        """Get the selected job's formatted salary range (empty if no job is selected)."""
+        job = self._selected_job
+        return (job["salary_range_formatted"] or "") if job else ""
 
-        return "No date set"
+    @rx.var
+    def selected_job_url(self) -> str:
+        """Get the selected job's job URL (empty if no job is selected)."""
+        job = self._selected_job
+        return (job["job_url"] or "") if job else ""
 
     @rx.var
     def filtered_templates(self) -> List[Dict]:
@@ -196,42 +335,155 @@ class State(rx.State):
         query = self.template_search_query.lower()
 
         return [
-            t
-            for t in self.templates
-            if query in t["name"].lower() or query in t["content"].lower()
+            template
+            for template, search in zip(self.templates, self._col_template_search)
+            if query in search
         ]
 
+    @rx.var
+    def visible_templates(self) -> List[Dict]:
+        """Get the first templates_visible_count filtered templates, the only ones rendered in the lists."""
+        return self.filtered_templates[:self.templates_visible_count]
+
+    @rx.var
+    def has_more_templates(self) -> bool:
+        """Whether filtered templates are hidden beyond the visible window."""
+        return len(self.filtered_templates) > self.templates_visible_count
+
     @rx.var
     def selected_template(self) -> Dict | None:
         """Get the currently selected template."""
+        return self._templates_by_id.get(self.selected_template_id)
 
-        for template in self.templates:
-
-            if template.get("id") == self.selected_template_id:
-                return template
+    @rx.var
+    def form_message_color(self) -> str:
+        """Get the callout color scheme for the current form message."""
+        return "green" if self.form_message_type == "success" else "red"
 
-        return None
+    @rx.var
+    def form_message_icon(self) -> str:
+        """Get the callout icon for the current form message."""
+        return "info" if self.form_message_type == "success" else "alert-triangle"
 
     # EVENT HANDLERS
+    def _set_form_message(self, message: str, message_type: str) -> None:
+        """Show a form message ("success" or "error") and bump the message sequence."""
+        self.form_message = message
+        self.form_message_type = message_type
+        self._form_message_seq += 1
+
     def load_jobs_from_db(self) -> None:
         """Load all jobs from database and convert to dict format."""
 
-        db = SessionLocal()
-
-        try:
-            job_records = db.query(JobApplication).order_by(JobApplication.application_date.desc()).all()
-            self.jobs = [job.to_dict() for job in job_records]
+        with session_scope() as db:
+            job_records = get_all_jobs(db)
+            jobs = [self._job_to_dict(job) for job in job_records]
+
+        self._jobs = jobs
+        self._jobs_by_id = {job["id"]: job for job in jobs}
+        self._rebuild_job_columns()
+
+    @staticmethod
+    def _job_to_dict(job_record: JobApplication) -> Dict:
+        """Convert a job record to its state dict, adding display fields computed once at load."""
+        job = job_record.to_dict()
+        job["application_date_formatted"] = formatters.format_date(job["application_date"])
+
+        # Newest note first, so the detail page can render the list as-is; the timestamp is
+        # formatted here once (new dicts, so the record's JSON value is left untouched)
+        job["notes"] = [
+            {**note, "timestamp_formatted": formatters.format_datetime(note["timestamp"])}
+            for note in sorted(job["notes"] or [], key=lambda note: note["timestamp"], reverse=True)
+        ]
 
-        finally:
-            db.close()
+        # Plain flags so the job cards branch on a bool instead of a string/list truthiness check
+        job["has_notes"] = bool(job["notes"])
+        job["has_salary"] = bool(job["salary_range_formatted"])
+        return job
+
+    def _rebuild_job_columns(self) -> None:
+        """Rebuild the job columns, active-jobs list and facets in one pass, then bump the jobs version."""
+        col_company = []
+        col_status = []
+        col_location = []
+        col_search = []
+        active_jobs = []
+        companies = set()
+        statuses = set()
+        locations = set()
+
+        for job in self._jobs:
+            col_company.append(job["company_name"])
+            col_status.append(job["status"])
+            col_location.append(job["location"])
+            # Newline separator: the single-line search input can't match across the two fields
+            col_search.append(f"{job['company_name']}\n{job['job_title']}".casefold())
+
+            companies.add(job["company_name"])
+            statuses.add(job["status"])
+            locations.add(job["location"])
+
+            if job["status"] not in _EXCLUDED_STATUSES:
+                active_jobs.append(job)
+
+        self._col_company = col_company
+        self._col_status = col_status
+        self._col_location = col_location
+        self._col_search = col_search
+        self._active_jobs = active_jobs
+        self.total_jobs_count = len(self._jobs)
+        self.unique_companies = [_ALL_COMPANIES, *sorted(companies)]
+        self.unique_statuses = [_ALL_STATUSES, *sorted(statuses)]
+        self.unique_locations = [_ALL_LOCATIONS, *sorted(locations)]
+        self._jobs_version += 1
+
+    def _patch_job(self, job_record: JobApplication) -> None:
+        """Refresh one job in self._jobs from its updated record instead of reloading every job."""
+        updated = self._job_to_dict(job_record)
+        self._update_job_fields(updated["id"], updated)
+
+    def _update_job_fields(self, job_id: int, fields: Dict) -> None:
+        """Merge fields into one loaded job and rebuild the derived job columns."""
+        job = self._jobs_by_id.get(job_id)
+
+        if job is not None:
+            job.update(fields)
+
+            # Backend-only containers, so nothing is sent to the browser; the derived vars
+            # are invalidated by the _jobs_version bump in _rebuild_job_columns
+            self._jobs_by_id = self._jobs_by_id
+
+        self._rebuild_job_columns()
 
     def load_index_page(self) -> None:
         """Handler for index page load - loads jobs and clears messages."""
         self.load_jobs_from_db()
+        self.jobs_page = 0
         self.form_message = ""  # Clear any form messages
         self.form_message_type = ""
         self.status_edit_mode = False
 
+    # Filter setters: a new search or filter always starts the job list on its first page
+    def set_search_query(self, value: str) -> None:
+        """Set the search query and go back to the first job list page."""
+        self.search_query = value
+        self.jobs_page = 0
+
+    def set_selected_company(self, value: str) -> None:
+        """Set the company filter and go back to the first job list page."""
+        self.selected_company = value
+        self.jobs_page = 0
+
+    def set_selected_status(self, value: str) -> None:
+        """Set the status filter and go back to the first job list page."""
+        self.selected_status = value
+        self.jobs_page = 0
+
+    def set_selected_location(self, value: str) -> None:
+        """Set the location filter and go back to the first job list page."""
+        self.selected_location = value
+        self.jobs_page = 0
+
     def load_add_job_page(self) -> None:
         """Handler for add job page load - clears form messages."""
         self.clear_form()
@@ -241,83 +493,93 @@ class State(rx.State):
     def load_job(self) -> Dict | None:
         """Load a job by ID from URL parameter."""
 
-        # Load fresh data from database
-        self.load_jobs_from_db()
+        # Access the route parameter from router state
+        job_id = self.router.page.params.get("job_id", "0")
+
+        try:
+            job_id = int(job_id)
+        except (ValueError, TypeError):
+            job_id = 0
+
+        # A job already in state is refreshed with a primary-key lookup (it may have been
+        # changed from another session); otherwise, or if it was deleted, reload every job
+        job_record = None
+        if job_id in self._jobs_by_id:
+            with session_scope() as db:
+                job_record = get_job_by_id(db, job_id)
+                if job_record is not None:
+                    self._patch_job(job_record)
+
+        if job_record is None:
+            self.load_jobs_from_db()
         self.load_templates_from_db()
 
-        # Clear template search query for fresh page load
+        # Clear template search query and the templates window for fresh page load
         self.template_search_query = ""
+        self.templates_visible_count = _TEMPLATES_PAGE_SIZE
 
-        # Reset edit mode on page load
+        # Reset edit mode, the notes window and the Add Note form on page load
         self.status_edit_mode = False
+        self.notes_visible_count = _NOTES_PAGE_SIZE
+        self.add_note_open = False
 
-        # Access the route parameter from router state
-        job_id = self.router.page.params.get("job_id", "0")
+        self.selected_job_id = job_id
 
-        try:
-            self.selected_job_id = int(job_id)
-
-            # Load current status for editing
-            if self.selected_job:
-                self.detail_status = self.selected_job.get("status", "Applied")
-
-        except (ValueError, TypeError):
-            self.selected_job_id = 0
+        # Load current status for editing
+        if self._selected_job:
+            self.detail_status = self._selected_job.get("status", "Applied")
 
     def handle_submit(self):
         """Handle job form submission."""
 
         # 1. Validate required fields
         if not self.form_company_name or not self.form_job_url or not self.form_job_title:
-            self.form_message = "Please fill in all required fields (Company, Title, URL)"
-            self.form_message_type = "error"
+            self._set_form_message("Please fill in all required fields (Company, Title, URL)", "error")
             return None # Don't proceed
 
+        # 1a. Validate the job URL shape before touching the database; the stripped URL is
+        # also the one stored, so surrounding whitespace can't slip past the duplicate check
+        job_url = self.form_job_url.strip()
+        if not _URL_RE.match(job_url):
+            self._set_form_message("Please enter a valid job URL starting with http:// or https://", "error")
+            return None
+
         # 1b. Validate location if "Other" is selected
         if self.form_location_is_other and not self.form_location:
-            self.form_message = "Please enter a custom location or select a preset location"
-            self.form_message_type = "error"
+            self._set_form_message("Please enter a custom location or select a preset location", "error")
             return None
 
         # 2. Clear any previous messages
         self.form_message = ""
         self.form_message_type = ""
 
-        # 3. Create database session
-        db_session = SessionLocal()
-
         try:
 
-            # 4. Attempt to create job
-            result = create_job(
-                session=db_session,
-                job_data={
-                    "company_name": self.form_company_name,
-                    "job_title": self.form_job_title,
-                    "job_url": self.form_job_url,
-                    "location": self.form_location,
-                    "description": self.form_description,
-                    "salary_range": self.form_salary_range,
-                }
-            )
-
-            # 5. Success - set message and redirect
-            self.form_message = f"Success! {self.form_job_title} at {self.form_company_name} has been saved."
-            self.form_message_type = "success"
-            self.clear_form()
-            return rx.redirect("/")
+            # 3. Attempt to create job (the session is closed when the block exits)
+            with session_scope() as db_session:
+                create_job(
+                    session=db_session,
+                    job_data={
+                        "company_name": self.form_company_name,
+                        "job_title": self.form_job_title,
+                        "job_url": job_url,
+                        "location": self.form_location,
+                        "description": self.form_description,
+                        "salary_range": self.form_salary_range,
+                    }
+                )
 
         except ValueError as e:
 
-            # 6. Error - show message, keep form data for user to fix
-            self.form_message = f"Error: {str(e)}"
-            self.form_message_type = "error"
+            # 4. Error - show message, keep form data for user to fix
+            self._set_form_message(f"Error: {str(e)}", "error")
             # Don't clear form or redirect - user needs to fix the issue
+            return None
 
-        finally:
-
-            # 7. Always closes the session
-            db_session.close()
+        # 5. Success - set message and redirect
+        self._set_form_message(f"Success! {self.form_job_title} at {self.form_company_name} has been saved.", "success")
+        self.clear_form()
+        return rx.redirect("/")
 
     def clear_form(self) -> None:
         """Reset all form fields to defaults."""
@@ -346,15 +608,15 @@ class State(rx.State):
 
     def handle_cancel_job_creation(self) -> None:
         """Handle cancel button click - show confirmation if form has data."""
-        # Check if any form fields have been filled
-        has_data = any([
-            self.form_company_name,
-            self.form_job_title,
-            self.form_job_url,
-            self.form_location,
-            self.form_description,
-            self.form_salary_range,
-        ])
+        # Check if any form fields have been filled (short-circuits, no temporary list)
+        has_data = bool(
+            self.form_company_name
+            or self.form_job_title
+            or self.form_job_url
+            or self.form_location
+            or self.form_description
+            or self.form_salary_range
+        )
 
         if has_data:
             # Show confirmation dialog
@@ -373,193 +635,263 @@ class State(rx.State):
         """Dismiss the cancel confirmation dialog."""
         self.show_cancel_job_dialog = False
 
-    def handle_add_note(self) -> Generator[Dict, None, None]:
+    def handle_add_note(self) -> None:
         """Handle adding a note to the current job."""
 
-        # Validate note text
-        if not self.new_note_text or not self.new_note_text.strip():
+        # Validate note text before touching the database
+        note_text = self.new_note_text.strip()
+        if not note_text:
             return  # Don't add empty notes
 
-        db = SessionLocal()
         try:
+            with session_scope() as db:
+
+                # Add note to database
+                result = add_note(db, self.selected_job_id, note_text)
 
-            # Add note to database
-            result = add_note(db, self.selected_job_id, self.new_note_text.strip())
+                if result:
 
-            if result:
+                    # Patch the updated notes into the loaded job (no full reload)
+                    self._patch_job(result)
 
-                # Clear the input
-                self.new_note_text = ""
+        except Exception as e:
+            self._set_form_message(f"Error adding note: {str(e)}", "error")
+            return
 
-                # Clear template search to avoid any filtering issues
-                self.template_search_query = ""
+        if result:
 
-                # Reload jobs from database to get updated notes
-                self.load_jobs_from_db()
+            # Clear the input and close the form
+            self.new_note_text = ""
+            self.add_note_open = False
 
-                # Force state refresh by yielding
-                yield
+            # Clear template search to avoid any filtering issues
+            self.template_search_query = ""
 
-        except Exception as e:
-            self.form_message = f"Error adding note: {str(e)}"
-            self.form_message_type = "error"
-        finally:
-            db.close()
+        # No yield: Reflex sends the patched notes and cleared inputs as a single delta on return
 
     def handle_status_update(self):
-        """Handle status update for the current job."""
-        from applog.services.job_service import update_job
-        from applog.models.job_application import ApplicationStatus
+        """Handle status update for the current job.
 
-        if not self.detail_status:
+        The new status is shown right away, then written to the database; it is rolled back if the write fails.
+        """
+        new_status = self.detail_status
+        job = self._selected_job
+
+        if not new_status or job is None:
             return
 
-        db = SessionLocal()
+        previous_status = job["status"]
+
+        # Optimistic update: show the new badge and exit edit mode before the database round-trip
+        self._update_job_fields(self.selected_job_id, {"status": new_status})
+        self.status_edit_mode = False
+        yield
+
         try:
+            with session_scope() as db:
 
-            # Convert status string to Enum
-            status_enum = ApplicationStatus(self.detail_status)
+                # Convert status string to Enum
+                status_enum = ApplicationStatus(new_status)
 
-            # Update job status
-            result = update_job(db, self.selected_job_id, {"status": status_enum})
+                # Update job status
+                result = update_job(db, self.selected_job_id, {"status": status_enum})
 
-            if result:
+                if result:
 
-                # Reload jobs from database
-                self.load_jobs_from_db()
+                    # Reconcile with the stored record (e.g. updated_at), no full reload
+                    self._patch_job(result)
+                    return
 
-                # Exit edit mode
-                self.status_edit_mode = False
+            # update_job found no such row: the job was deleted meanwhile
+            self._set_form_message("Error updating status: this job no longer exists", "error")
 
         except Exception as e:
-            self.form_message = f"Error updating status: {str(e)}"
-            self.form_message_type = "error"
-        finally:
-            db.close()
+            self._set_form_message(f"Error updating status: {str(e)}", "error")
+
+        # The write failed or the job no longer exists: roll back the optimistic update
+        self._update_job_fields(self.selected_job_id, {"status": previous_status})
+        self.detail_status = previous_status
+
+    def next_jobs_page(self) -> None:
+        """Show the next page of the job list."""
+        if self.has_next_jobs_page:
+            self.jobs_page = self.current_jobs_page + 1
+
+    def prev_jobs_page(self) -> None:
+        """Show the previous page of the job list."""
+        self.jobs_page = max(0, self.current_jobs_page - 1)
+
+    def show_more_templates(self) -> None:
+        """Reveal the next page of filtered templates in the template lists."""
+        self.templates_visible_count += _TEMPLATES_PAGE_SIZE
+
+    def toggle_add_note_open(self) -> None:
+        """Show or hide the Add Note form."""
+        self.add_note_open = not self.add_note_open
+
+    def show_more_notes(self) -> None:
+        """Reveal the next page of older notes in Note History."""
+        self.notes_visible_count += _NOTES_PAGE_SIZE
+
+    def cancel_status_edit(self) -> None:
+        """Leave status edit mode and drop the unsaved dropdown choice in one event."""
+        job = self._selected_job
+        self.detail_status = job["status"] if job else ""
+        self.status_edit_mode = False
 
     def handle_delete_job(self):
 
-        db = SessionLocal()
         try:
-            if delete_job(db, self.selected_job_id):
-                # todo printing message ?
-                # self.form_message = f"Success! {self.selected_job["job_title"]} at {self.selected_job["job_company"]} has been deleted."
-                # self.form_message_type = "success"
-                self.show_delete_dialog = False
-                return rx.redirect("/")
-            else:
-                self.form_message = "Operation aborted"
-                self.form_message_type = "error"
+            with session_scope() as db:
+                deleted = delete_job(db, self.selected_job_id)
         except Exception as e:
-            self.form_message = f"Error deleting job: {str(e)}"
-            self.form_message_type = "error"
-        finally:
-            db.close()
+            self._set_form_message(f"Error deleting job: {str(e)}", "error")
+            return
+
+        if deleted:
+            # todo printing message ?
+            # self.form_message = f"Success! {self._selected_job["job_title"]} at {self._selected_job["job_company"]} has been deleted."
+            # self.form_message_type = "success"
+            self.show_delete_dialog = False
+            return rx.redirect("/")
+        else:
+            self._set_form_message("Operation aborted", "error")
 
     # TEMPLATE MANAGEMENT HANDLERS
-    def load_templates_from_db(self):
-        """Load all templates from database."""
-        db = SessionLocal()
-        try:
+    def load_templates_from_db(self, force: bool = False):
+        """Load all templates from database, unless no template was written since the last load.
+
+        Args:
+            force: Reload even if the generation is unchanged (picks up writes made outside this process).
+        """
+        generation = get_templates_generation()
+        if not force and generation == self._templates_generation:
+            return
+
+        with session_scope() as db:
             template_records = get_all_templates(db)
-            self.templates = [t.to_dict() for t in template_records]
-        finally:
-            db.close()
+            templates = [t.to_dict() for t in template_records]
+
+        self.templates = templates
+        self._templates_by_id = {t["id"]: t for t in templates}
+        # Unit separator between the fields: a typed query can't match across them
+        self._col_template_search = [f"{t['name']}\x1f{t['content']}".lower() for t in templates]
+        # Read before the query: a write racing with this load forces another reload next time
+        self._templates_generation = generation
 
     def load_templates_page(self):
         """Handler for templates page load."""
-        self.load_templates_from_db()
+        self.load_templates_from_db(force=True)
+        self.templates_visible_count = _TEMPLATES_PAGE_SIZE
         self.form_message = ""
         self.form_message_type = ""
 
-    async def handle_template_submit(self):
+    def handle_template_submit(self):
         """Handle template form submission (create or update)."""
-        import asyncio
 
         if not self.form_template_name or not self.form_template_content:
-            self.form_message = "Please fill in both name and content"
-            self.form_message_type = "error"
+            self._set_form_message("Please fill in both name and content", "error")
             return
 
-        db = SessionLocal()
         try:
-            if self.template_edit_mode and self.selected_template_id:
-                # Update existing template
-                result = update_template(
-                    db,
-                    self.selected_template_id,
-                    {
-                        "name": self.form_template_name,
-                        "content": self.form_template_content,
-                    },
-                )
-                if result:
-                    self.form_message = "Template updated successfully!"
-                    self.form_message_type = "success"
-            else:
-                # Create new template
-                result = create_template(
-                    db,
-                    {
-                        "name": self.form_template_name,
-                        "content": self.form_template_content,
-                    },
-                )
-                self.form_message = "Template created successfully!"
-                self.form_message_type = "success"
+            with session_scope() as db:
+                if self.template_edit_mode and self.selected_template_id:
+                    # Update existing template
+                    result = update_template(
+                        db,
+                        self.selected_template_id,
+                        {
+                            "name": self.form_template_name,
+                            "content": self.form_template_content,
+                        },
+                    )
+                    if result:
+                        self._set_form_message("Template updated successfully!", "success")
+                else:
+                    # Create new template
+                    result = create_template(
+                        db,
+                        {
+                            "name": self.form_template_name,
+                            "content": self.form_template_content,
+                        },
+                    )
+                    self._set_form_message("Template created successfully!", "success")
+        except ValueError as e:
+            self._set_form_message(f"Error: {str(e)}", "error")
+            return
 
-            self.clear_template_form()
-            self.load_templates_from_db()
+        self.clear_template_form()
+        self.load_templates_from_db()
 
-            # Auto-clear success message after 3 seconds
-            yield
-            await asyncio.sleep(3)
-            self.form_message = ""
-            self.form_message_type = ""
-        except ValueError as e:
-            self.form_message = f"Error: {str(e)}"
-            self.form_message_type = "error"
-        finally:
-            db.close()
+        # Auto-clear success message in a background task so this handler returns right away
+        return State.clear_form_message_after_delay(self._form_message_seq)
+
+    @rx.event(background=True)
+    async def clear_form_message_after_delay(self, message_seq: int):
+        """Clear the form message after 3 seconds (background task, holds no state lock while waiting).
+
+        Args:
+            message_seq: _form_message_seq of the message to clear; left alone if a newer
+                message (even one with the same text) was set meanwhile.
+        """
+        await asyncio.sleep(3)
+
+        async with self:
+            if self._form_message_seq == message_seq:
+                self.form_message = ""
+                self.form_message_type = ""
 
     def handle_edit_template(self, template_id: int):
         """Load template data into form for editing."""
-        for template in self.templates:
-            if template["id"] == template_id:
-                self.selected_template_id = template_id
-                self.form_template_name = template["name"]
-                self.form_template_content = template["content"]
-                self.template_edit_mode = True
-                break
+        template = self._templates_by_id.get(template_id)
+
+        if template is None:
+            return
+
+        self.selected_template_id = template_id
+        self.form_template_name = template["name"]
+        self.form_template_content = template["content"]
+        self.template_edit_mode = True
+
+    def open_delete_template_dialog(self, template_id: int):
+        """Select a template and open its delete confirmation dialog in one event."""
+        self.selected_template_id = template_id
+        self.show_delete_template_dialog = True
 
     def handle_delete_template(self):
         """Delete the selected template."""
-        db = SessionLocal()
         try:
-            if delete_template(db, self.selected_template_id):
-                self.form_message = "Template deleted successfully!"
-                self.form_message_type = "success"
-                self.show_delete_template_dialog = False
-                self.load_templates_from_db()
-            else:
-                self.form_message = "Template not found"
-                self.form_message_type = "error"
+            with session_scope() as db:
+                deleted = delete_template(db, self.selected_template_id)
         except Exception as e:
-            self.form_message = f"Error deleting template: {str(e)}"
-            self.form_message_type = "error"
-        finally:
-            db.close()
+            self._set_form_message(f"Error deleting template: {str(e)}", "error")
+            return
+
+        if deleted:
+            self._set_form_message("Template deleted successfully!", "success")
+            self.show_delete_template_dialog = False
+            self.load_templates_from_db()
+        else:
+            self._set_form_message("Template not found", "error")
 
     def handle_insert_template(self, template_id: int):
         """Insert selected template content into note textarea."""
-        for template in self.templates:
-            if template["id"] == template_id:
-                # Insert at end of current text (or replace if empty)
-                if self.new_note_text:
-                    self.new_note_text += "\n" + template["content"]
-                else:
-                    self.new_note_text = template["content"]
-                break
+        template = self._templates_by_id.get(template_id)
+
+        if template is None:
+            return
+
+        # Insert at end of current text (or replace if empty)
+        if self.new_note_text:
+            self.new_note_text += "\n" + template["content"]
+        else:
+            self.new_note_text = template["content"]
+
+    def handle_insert_template_and_close(self, template_id: int):
+        """Insert a template from the "View All" dialog and close the dialog in one event."""
+        self.handle_insert_template(template_id)
+        self.show_templates_dialog = False
 
     def clear_template_form(self):
         """Clear template form fields."""
@@ -600,5 +932,5 @@ app.add_page(add_job_page, route="/add-job", on_load=State.load_add_job_page)
 app.add_page(job_detail_page, route="/job/[job_id]", on_load=State.load_job)
 app.add_page(templates_page, route="/templates", on_load=State.load_templates_page)
 
-# Initialize database tables on app startup
-init_db()
+# Initialize database tables when the backend starts, not at import time
+app.register_lifespan_task(init_db)
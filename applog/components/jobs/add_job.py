@@ -1,5 +1,16 @@
 import reflex as rx
 
+from applog.components.shared.options import STATUS_OPTIONS
+
+_LOCATION_OPTIONS = [
+    "Geneva",
+    "Lausanne",
+    "Nyon",
+    "Gland",
+    "Bern",
+    "Other",
+]
+
 def _job_form_header(state: rx.State):
     """
     📋 Renders the form page header.
@@ -107,14 +118,7 @@ def _optional_field_location(state: rx.State):
     return rx.vstack(
         rx.text("Location", weight="bold", size="2"),
         rx.select(
-            [
-                "Geneva",
-                "Lausanne",
-                "Nyon",
-                "Gland",
-                "Bern",
-                "Other",
-            ],
+            _LOCATION_OPTIONS,
             placeholder="Select a location...",
             value=rx.cond(
                 state.form_location_is_other,
@@ -150,16 +154,7 @@ def _optional_field_status(state: rx.State):
 
         rx.text("Status", weight="bold", size="2"),
         rx.select(
-            [
-                "Applied",
-                "Screening",
-                "Interview",
-                "Offer",
-                "Rejected",
-                "Accepted",
-                "Withdrawn",
-                "No Response",
-            ],
+            STATUS_OPTIONS,
             value=state.form_status,
             on_change=state.set_form_status,
             width="100%",
@@ -210,18 +205,21 @@ def _optional_field_salary_range(state: rx.State):
 
 def _optional_field_description(state: rx.State):
     """
-    📄 Renders Job Description textarea field (optional).
+    📄 Renders Job Description textarea field (optional, debounced: one state update per typing pause).
     Visual: Label "Job Description" + expandable text area for longer text input
     """
     return rx.vstack(
         rx.text("Job Description", weight="bold", size="2"),
-        rx.text_area(
-            placeholder="Paste or write the job description here...",
-            value=state.form_description,
-            on_change=state.set_form_description,
-            width="100%",
-            min_height="150px",
-            resize="vertical",
+        rx.debounce_input(
+            rx.text_area(
+                placeholder="Paste or write the job description here...",
+                value=state.form_description,
+                on_change=state.set_form_description,
+                width="100%",
+                min_height="150px",
+                resize="vertical",
+            ),
+            debounce_timeout=250,
         ),
         spacing="2",
         align_items="start",
@@ -255,20 +253,11 @@ def _optional_field_message_display(state: rx.State):
     """
     return rx.cond(
         state.form_message,
-        rx.cond(
-            state.form_message_type == "success",
-            rx.callout(
-                state.form_message,
-                icon="info",
-                color_scheme="green",
-                size="2",
-            ),
-            rx.callout(
-                state.form_message,
-                icon="alert-triangle",
-                color_scheme="red",
-                size="2",
-            ),
+        rx.callout(
+            state.form_message,
+            icon=state.form_message_icon,
+            color_scheme=state.form_message_color,
+            size="2",
         ),
     )
 
@@ -1,10 +1,7 @@
 import reflex as rx
 from typing import Dict
 
-from applog.components.shared import (
-    status_badge,
-    formatters
-)
+from applog.components.shared import status_badge
 
 def _job_card_heading(job: Dict) -> rx.Component:
     """
@@ -32,7 +29,7 @@ def _job_card_metadata(job: Dict) -> rx.Component:
     """
     return rx.hstack(
         rx.text(f"📍 {job['location']}", size="2", color=rx.color("gray", 11)),
-        rx.text(f"📅 {formatters.format_date(job['application_date'])}", size="2", color=rx.color("gray", 11)),
+        rx.text(f"📅 {job['application_date_formatted']}", size="2", color=rx.color("gray", 11)),
         spacing="4",
     )
 
@@ -42,7 +39,7 @@ def _job_card_salary(job: Dict) -> rx.Component:
     Visual: "💰 120K - 150K" (only displayed if salary data exists)
     """
     return rx.cond(
-        job.get("salary_range_formatted"),
+        job["has_salary"],
         rx.text(
             f"💰 {job['salary_range_formatted']}", size="2", color=rx.color("gray", 11), weight="medium"
         ),
@@ -54,7 +51,7 @@ def _job_card_notes(job: Dict) -> rx.Component:
     Visual: "📝 Has notes" in italic gray text (only shown if notes exist)
     """
     return rx.cond(
-                job.get("notes"),
+                job["has_notes"],
                 rx.text(
                     "📝 Has notes",
                     size="2",
@@ -123,4 +120,13 @@ def render_ui(job: Dict) -> rx.Component:
         ),
 
         **_formatting_job_card
-    )
\ No newline at end of file
+    )
+
+
+@rx.memo
+def render_ui_memo(job: rx.Var[Dict]) -> rx.Component:
+    """
+    🧠 Memoized wrapper around render_ui() for use in rx.foreach.
+    Visual: Same card as render_ui(); React skips re-rendering cards whose job prop is unchanged.
+    """
+    return render_ui(job)
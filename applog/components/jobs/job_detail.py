@@ -3,8 +3,9 @@ import reflex as rx
 from applog.components.shared import (
     status_badge
 )
+from applog.components.shared.options import STATUS_OPTIONS
 
-from applog.components.jobs.notes import timeline
+from applog.components.jobs.notes import timeline_memo
 
 def _page_heading() -> rx.Component:
     """
@@ -47,7 +48,7 @@ def _button_cancel(state: rx.State) -> rx.Component:
         "Cancel",
         size="1",
         variant="soft",
-        on_click=state.set_status_edit_mode(False),
+        on_click=state.cancel_status_edit,
     )
 
 def _button_edit(state: rx.State) -> rx.Component:
@@ -68,16 +69,7 @@ def _status_dropdown(state: rx.State) -> rx.Component:
     Visual: Select dropdown with all available status options
     """
     return rx.select(
-        [
-            "Applied",
-            "Screening",
-            "Interview",
-            "Offer",
-            "Rejected",
-            "Accepted",
-            "Withdrawn",
-            "No Response",
-        ],
+        STATUS_OPTIONS,
         value=state.detail_status,
         on_change=state.set_detail_status,
         size="2",
@@ -93,7 +85,7 @@ def _company_and_status(state: rx.State) -> rx.Component:
 
         rx.heading(
 
-            state.selected_job["company_name"],
+            state.selected_job_company_name,
             size="6",
         ),
 
@@ -112,7 +104,7 @@ def _company_and_status(state: rx.State) -> rx.Component:
             ),
 
             rx.hstack(
-                status_badge(state.selected_job["status"]),
+                status_badge(state.selected_job_status),
 
                 _button_edit(state),
 
@@ -129,42 +121,53 @@ def _job_title(state: rx.State) -> rx.Component:
     Visual: Medium-sized gray heading (e.g., "Senior Python Developer")
     """
     return rx.heading(
-        state.selected_job["job_title"],
+        state.selected_job_title,
         size="4",
         color=rx.color("gray", 11),
         weight="medium",
     )
 
-def _grid_location(state: rx.State) -> rx.Component:
+_formatting_detail_label = {
+    "weight": "bold",
+    "size": "2",
+}
+
+_formatting_detail_value = {
+    "size": "2",
+    "color": rx.color("gray", 11),
+}
+
+def _detail_row(label: str, value: rx.Component) -> rx.Component:
     """
-    📍 Renders location detail row.
-    Visual: "📍 Location: San Francisco, CA"
+    🏷️ Renders one "label + value" detail row.
+    Visual: "<bold label> <value>" (e.g., "📍 Location: San Francisco, CA")
     """
     return rx.hstack(
-        rx.text("📍 Location:", weight="bold", size="2"),
+        rx.text(label, **_formatting_detail_label),
+
+        value,
 
-        rx.text(
-            state.selected_job["location"],
-            size="2",
-            color=rx.color("gray", 11),
-        ),
         spacing="2",
     )
 
+def _grid_location(state: rx.State) -> rx.Component:
+    """
+    📍 Renders location detail row.
+    Visual: "📍 Location: San Francisco, CA"
+    """
+    return _detail_row(
+        "📍 Location:",
+        rx.text(state.selected_job_location, **_formatting_detail_value),
+    )
+
 def _grid_applied_status(state: rx.State) -> rx.Component:
     """
     📅 Renders application date detail row.
     Visual: "📅 Applied: 25/12/2025"
     """
-    return rx.hstack(
-        rx.text("📅 Applied:", weight="bold", size="2"),
-
-        rx.text(
-            state.selected_job_application_date_formatted,
-            size="2",
-            weight="medium",
-        ),
-        spacing="2",
+    return _detail_row(
+        "📅 Applied:",
+        rx.text(state.selected_job_application_date_formatted, size="2", weight="medium"),
     )
 
 def _grid_salary_conditional(state: rx.State) -> rx.Component:
@@ -173,18 +176,11 @@ def _grid_salary_conditional(state: rx.State) -> rx.Component:
     Visual: "💰 Salary: 120K - 150K" (only shown if salary data exists)
     """
     return rx.cond(
-        state.selected_job.get("salary_range_formatted"),
+        state.selected_job_has_salary,
 
-        rx.hstack(
-
-            rx.text("💰 Salary:", weight="bold", size="2"),
-
-            rx.text(
-                state.selected_job["salary_range_formatted"],
-                size="2",
-                color=rx.color("gray", 11),
-            ),
-            spacing="2",
+        _detail_row(
+            "💰 Salary:",
+            rx.text(state.selected_job_salary, **_formatting_detail_value),
         ),
     )
 
@@ -194,17 +190,17 @@ def _grid_url_conditional(state: rx.State) -> rx.Component:
     Visual: "🔗 URL: [clickable link]" (only shown if URL exists)
     """
     return rx.cond(
-        state.selected_job.get("job_url"),
-        rx.hstack(
-            rx.text("🔗 URL:", weight="bold", size="2"),
+        state.selected_job_has_url,
+
+        _detail_row(
+            "🔗 URL:",
             rx.link(
-                state.selected_job["job_url"],
-                href=state.selected_job["job_url"],
+                state.selected_job_url,
+                href=state.selected_job_url,
                 size="2",
                 color=rx.color("brown", 11),
                 is_external=True,
             ),
-            spacing="2",
         ),
     )
 
@@ -244,16 +240,34 @@ def _note_history_no_notes_text():
         font_style="italic",
     )
 
+def _button_show_more_notes(state: rx.State):
+    """
+    ⏬ Conditionally renders the button revealing older notes.
+    Visual: Small ghost-variant "Show older notes" button (only shown if notes are hidden)
+    """
+    return rx.cond(
+        state.has_more_notes,
+        rx.button(
+            "Show older notes",
+            size="1",
+            variant="ghost",
+            on_click=state.show_more_notes,
+        ),
+    )
+
 def _note_history_list(state: rx.State):
     """
-    📜 Renders the list of notes using timeline components.
-    Visual: Vertical stack of timeline items (newest first)
+    📜 Renders the visible window of notes using timeline components.
+    Visual: Vertical stack of timeline items (newest first) + "Show older notes" button
     """
     return rx.vstack(
         rx.foreach(
-            state.selected_job_notes,
-            timeline,
+            state.visible_notes,
+            lambda note: timeline_memo(note=note),
         ),
+
+        _button_show_more_notes(state),
+
         spacing="0",
         width="100%",
     )
@@ -263,40 +277,29 @@ _formatting_note_history_conditional = {
     "align_items": "start",
 }
 
-_formatting_note_section_history = {
-    "padding": "2em",
-    "width": "100%",
-    "margin_top": "1em",
-}
-
 def _section_note_history(state: rx.State):
     """
-    🗓️ Renders the note history section card.
-    Visual: Card with "Note History" heading + timeline of notes or placeholder text
+    🗓️ Renders the note history section.
+    Visual: "Note History" heading + timeline of notes or placeholder text
     Structure: Conditionally shows either note list or "no notes" message
     """
-    return rx.card(
-
-        rx.vstack(
-
-            rx.heading("Note History", size="5", margin_bottom="1em"),
+    return rx.vstack(
 
-            rx.cond(
+        rx.heading("Note History", size="5", margin_bottom="1em"),
 
-                # If this isn't empty...
-                state.selected_job_notes,
+        rx.cond(
 
-                # Execute this
-                _note_history_list(state),
+            # If this isn't empty...
+            state.selected_job_notes,
 
-                # Otherwise this
-                _note_history_no_notes_text(),
-            ),
+            # Execute this
+            _note_history_list(state),
 
-            **_formatting_note_history_conditional
+            # Otherwise this
+            _note_history_no_notes_text(),
         ),
 
-        **_formatting_note_section_history
+        **_formatting_note_history_conditional
     )
 
 _formatting_note_form_template_selection = {
@@ -359,7 +362,7 @@ def _button_template_selector(state: rx.State, template: dict):
         template["name"],
         size="2",
         variant="soft",
-        on_click=lambda: state.handle_insert_template(template["id"]),
+        on_click=state.handle_insert_template(template["id"]),
         width="100%",
     )
 
@@ -368,12 +371,15 @@ def _template_search_input(state: rx.State):
     🔍 Renders template search input field.
     Visual: Search box with "Search templates..." placeholder
     """
-    return rx.input(
-        placeholder="Search templates...",
-        value=state.template_search_query,
-        on_change=state.set_template_search_query,
-        width="100%",
-        size="2",
+    return rx.debounce_input(
+        rx.input(
+            placeholder="Search templates...",
+            value=state.template_search_query,
+            on_change=state.set_template_search_query,
+            width="100%",
+            size="2",
+        ),
+        debounce_timeout=150,
     )
 
 def _no_saved_templates_text():
@@ -407,10 +413,25 @@ _formatting_templates_tooltips_loop = {
     "width": "100%",
 }
 
+def _button_show_more_templates(state: rx.State):
+    """
+    ⏬ Conditionally renders the button revealing more templates.
+    Visual: Small ghost-variant "Show more templates" button (only shown if templates are hidden)
+    """
+    return rx.cond(
+        state.has_more_templates,
+        rx.button(
+            "Show more templates",
+            size="1",
+            variant="ghost",
+            on_click=state.show_more_templates,
+        ),
+    )
+
 def _template_selector_list(state: rx.State):
     """
-    📋 Renders the list of template buttons with tooltips.
-    Visual: Search input + scrollable list of template buttons (each with hover tooltip showing content)
+    📋 Renders the visible window of template buttons with tooltips.
+    Visual: Search input + scrollable list of template buttons (each with hover tooltip showing a content preview) + "Show more templates" button
     """
     return rx.vstack(
 
@@ -422,15 +443,17 @@ def _template_selector_list(state: rx.State):
 
                 rx.foreach(
 
-                    state.filtered_templates,
+                    state.visible_templates,
 
                     lambda template: rx.tooltip(
 
                         _button_template_selector(state, template),
-                        content=template["content"],
+                        content=template["content_preview"],
                     ),
                 ),
 
+                _button_show_more_templates(state),
+
                 **_formatting_template_tooltip,
             ),
 
@@ -484,16 +507,19 @@ def _note_form_template_selection(state: rx.State):
 
 def _note_input_textarea(state: rx.State):
     """
-    📝 Renders the note input textarea.
+    📝 Renders the note input textarea (debounced: one state update per typing pause).
     Visual: Expandable text area for entering note content
     """
-    return rx.text_area(
-        placeholder="Enter your note here (e.g., 'Recruiter called for phone screen', 'Sent thank you email')...",
-        value=state.new_note_text,
-        on_change=state.set_new_note_text,
-        width="100%",
-        min_height="100px",
-        resize="vertical",
+    return rx.debounce_input(
+        rx.text_area(
+            placeholder="Enter your note here (e.g., 'Recruiter called for phone screen', 'Sent thank you email')...",
+            value=state.new_note_text,
+            on_change=state.set_new_note_text,
+            width="100%",
+            min_height="100px",
+            resize="vertical",
+        ),
+        debounce_timeout=200,
     )
 
 def _button_add_note(state: rx.State):
@@ -513,14 +539,28 @@ _formatting_add_note_section = {
     "margin_top": "1em",
 }
 
+def _button_close_note_form(state: rx.State):
+    """
+    ❌ Renders Cancel button for the note form.
+    Visual: Soft-variant "Cancel" button that hides the Add Note form
+    """
+    return rx.button(
+        "Cancel",
+        size="3",
+        variant="soft",
+        color_scheme="gray",
+        on_click=state.toggle_add_note_open,
+    )
+
 def _add_note_section(state: rx.State):
     """
     ➕ Renders the "Add Note" button section.
-    Visual: Right-aligned "Add Note" button
+    Visual: Right-aligned [Cancel] [Add Note] buttons
     """
     return rx.hstack(
 
         rx.spacer(),
+        _button_close_note_form(state),
         _button_add_note(state),
 
         **_formatting_add_note_section
@@ -531,33 +571,61 @@ _formatting_section_note_form = {
     "width": "100%",
 }
 
-_formatting_section_note_form_card = {
+def _section_note_form(state: rx.State):
+    """
+    📝 Renders the "Add Note" form section.
+    Visual: "Add Note" heading + template selector + textarea + submit button
+    """
+    return rx.vstack(
+
+        rx.heading("Add Note", size="4", margin_bottom="1em"),
+
+        _note_form_template_selection(state),
+
+        _note_input_textarea(state),
+
+        _add_note_section(state),
+
+        **_formatting_section_note_form
+    )
+
+_formatting_notes_card = {
     "padding": "2em",
     "width": "100%",
     "margin_top": "1em",
 }
 
-def _section_note_form(state: rx.State):
+def _button_open_note_form(state: rx.State):
     """
-    📝 Renders the "Add Note" form card.
-    Visual: Card with "Add Note" heading + template selector + textarea + submit button
+    ➕ Renders the button that opens the Add Note form.
+    Visual: Soft-variant "+ Add Note" button
     """
-    return rx.card(
-
-        rx.vstack(
-
-            rx.heading("Add Note", size="4", margin_bottom="1em"),
+    return rx.button(
+        "+ Add Note",
+        size="2",
+        variant="soft",
+        on_click=state.toggle_add_note_open,
+    )
 
-            _note_form_template_selection(state),
+def _section_notes(state: rx.State):
+    """
+    🗒️ Renders the single notes card.
+    Visual: Card with Note History section + divider + Add Note form (or "+ Add Note" button until opened)
+    Structure: The form, its textarea and template selector are only mounted while add_note_open is set
+    """
+    return rx.card(
 
-            _note_input_textarea(state),
+        _section_note_history(state),
 
-            _add_note_section(state),
+        rx.divider(margin_y="1.5em"),
 
-            **_formatting_section_note_form
+        rx.cond(
+            state.add_note_open,
+            _section_note_form(state),
+            _button_open_note_form(state),
         ),
 
-        **_formatting_section_note_form_card
+        **_formatting_notes_card
     )
 
 def _button_delete_job(state: rx.State):
@@ -576,7 +644,7 @@ def _button_delete_job(state: rx.State):
 def _job_not_found_text():
     """
     ❓ Renders "Job not found" message.
-    Visual: Gray text shown when selected_job is None
+    Visual: Gray text shown when has_selected_job is False
     """
     return rx.text("Job not found.", size="4", color=rx.color("gray", 10))
 
@@ -588,8 +656,8 @@ def _job_information_card(state: rx.State):
     """
     return rx.cond(
 
-                # If this isn't empty / None...
-                state.selected_job,
+                # If the job exists...
+                state.has_selected_job,
 
                 # Execute this
                 rx.vstack(
@@ -612,9 +680,7 @@ def _job_information_card(state: rx.State):
                         width="100%",
                     ),
 
-                    _section_note_history(state),
-
-                    _section_note_form(state),
+                    _section_notes(state),
 
                     # Delete job button
                     rx.box(
@@ -677,10 +743,7 @@ def _button_template_insert(state: rx.State, template: dict):
         "Insert",
         size="1",
         variant="soft",
-        on_click=lambda: [
-            state.handle_insert_template(template["id"]),
-            state.set_show_templates_dialog(False),
-        ],
+        on_click=state.handle_insert_template_and_close(template["id"]),
     )
 
 _formatting_iteration_box = {
@@ -793,49 +856,61 @@ def _template_list_item(state: rx.State):
         **_formatting_lamba_box,
     )
 
-def _view_all_templates_dialog(state: rx.State):
+def _templates_dialog_body(state: rx.State):
     """
-    📖 Renders the "View All Templates" dialog.
-    Visual: Dialog with title + description + scrollable list of templates or "no templates" message + close button
+    📚 Renders the "View All Templates" dialog body.
+    Visual: Scrollable list of templates or "no templates" message
     Structure: Conditionally shows template list or placeholder text
     """
-    return rx.dialog.root(
+    return rx.box(
 
-            rx.dialog.content(
+        rx.cond(
 
-                rx.dialog.title("All Templates"),
+            # If this is not empty / None...
+            state.templates,
 
-                rx.dialog.description(
-                    "Click on a template name to insert it into your note."
-                ),
+            # Execute this
+            rx.vstack(
 
-                rx.box(
+                rx.foreach(
 
-                    rx.cond(
+                    # Iterable
+                    state.templates,
 
-                        # If this is not empty / None...
-                        state.templates,
+                    # Main iteration
+                    _template_list_item(state),
+                ),
 
-                        # Execute this
-                        rx.vstack(
+                **_formatting_iteration_box,
+            ),
 
-                            rx.foreach(
+            # Otherwise execute this
+            _no_saved_templates_text(),
+        ),
+
+        **_formatting_templates_conditional_box,
+    )
 
-                                # Iterable
-                                state.templates,
+def _view_all_templates_dialog(state: rx.State):
+    """
+    📖 Renders the "View All Templates" dialog.
+    Visual: Dialog with title + description + scrollable list of templates or "no templates" message + close button
+    Structure: The list body is only mounted while show_templates_dialog is set
+    """
+    return rx.dialog.root(
 
-                                # Main iteration
-                                _template_list_item(state),
-                            ),
+            rx.dialog.content(
 
-                            **_formatting_iteration_box,
-                        ),
+                rx.dialog.title("All Templates"),
 
-                        # Otherwise execute this
-                        _no_saved_templates_text(),
-                    ),
+                rx.dialog.description(
+                    "Click on a template name to insert it into your note."
+                ),
 
-                    **_formatting_templates_conditional_box,
+                # The template list is only mounted while the dialog is open
+                rx.cond(
+                    state.show_templates_dialog,
+                    _templates_dialog_body(state),
                 ),
 
                 _dialog_close_section(state),
@@ -11,15 +11,65 @@ _formatting_job_card_box = {
     "width": "100%"
 }
 
+_formatting_job_list_pagination_hstack = {
+    "spacing": "3",
+    "align_items": "center",
+    "justify": "center",
+    "width": "100%",
+}
+
+_formatting_job_list_pagination_button = {
+    "size": "2",
+    "variant": "soft",
+}
+
+def _job_list_pagination(state: rx.State) -> rx.Component:
+    """
+    📄 Renders the job list page controls, only when there is more than one page.
+    Visual: [< Previous]  Page 2 of 5  [Next >]
+    """
+    return rx.cond(
+        state.jobs_page_count > 1,
+        rx.hstack(
+            rx.button(
+                "< Previous",
+                on_click=state.prev_jobs_page,
+                disabled=~state.has_prev_jobs_page,
+
+                **_formatting_job_list_pagination_button,
+            ),
+            rx.text(
+                "Page ",
+                state.current_jobs_page + 1,
+                " of ",
+                state.jobs_page_count,
+                size="2",
+                color=rx.color("gray", 10),
+            ),
+            rx.button(
+                "Next >",
+                on_click=state.next_jobs_page,
+                disabled=~state.has_next_jobs_page,
+
+                **_formatting_job_list_pagination_button,
+            ),
+
+            **_formatting_job_list_pagination_hstack,
+        ),
+    )
+
 def render_ui(state: rx.State) -> rx.Component:
     """
-    📇 Renders the list of job application cards.
-    Visual: Vertical stack of job cards (company name, title, status, dates).
-            Each card is rendered by job_card.render_ui().
+    📇 Renders the current page of job application cards.
+    Visual: Vertical stack of job cards (company name, title, status, dates)
+            followed by [< Previous] Page X of Y [Next >] when there are several pages.
+            Each card is rendered by the memoized job_card.render_ui_memo().
     """
     return rx.box(
         rx.vstack(
-            rx.foreach(state.filtered_jobs, job_card.render_ui),
+            rx.foreach(state.paged_jobs, lambda job: job_card.render_ui_memo(job=job)),
+
+            _job_list_pagination(state),
 
             **_formatting_job_card_vstack,
         ),
@@ -1,23 +1,6 @@
 import reflex as rx
 from typing import Dict
 
-def _timeline_bullet():
-    """
-    🔵 Renders the circular bullet point on the timeline.
-    Visual: A small brown circle that marks each note entry.
-    """
-    return rx.box(
-
-        rx.box(
-            width="12px",
-            height="12px",
-            border_radius="50%",
-            bg=rx.color("brown", 9),
-        ),
-        width="12px",
-        flex_shrink="0",
-    )
-
 def _timeline_timestamp(note: Dict):
     """
     📅 Renders the timestamp text for the note.
@@ -25,11 +8,12 @@ def _timeline_timestamp(note: Dict):
     """
     return rx.text(
 
-        # Format timestamp using rx.moment for proper Var handling
-        rx.moment(note["timestamp"], format="DD/MM/YYYY HH:mm"),
+        # Preformatted on the backend when the job is loaded (no client-side moment.js)
+        note["timestamp_formatted"],
         size="1",
         color=rx.color("gray", 10),
         weight="medium",
+        margin_bottom="0.25em",
     )
 
 def _timeline_note_content(note: Dict):
@@ -43,55 +27,47 @@ def _timeline_note_content(note: Dict):
         color=rx.color("gray", 12),
     )
 
-def _timeline_text_container(note: Dict):
-    """
-    📦 Vertical container holding timestamp + note content.
-    Visual: Stacks the timestamp above the note text with minimal spacing.
-    """
-    return rx.vstack(
-
-        _timeline_timestamp(note),
-
-        _timeline_note_content(note),
-
-        spacing="1",
-        align_items="start",
-        flex="1",
-    )
-
-def _timeline_item_layout(note: Dict):
-    """
-    ↔️ Horizontal layout combining bullet + text container.
-    Visual: [🔵 bullet] [timestamp + note content]
-    """
-    return rx.hstack(
-
-        _timeline_bullet(),
-
-        _timeline_text_container(note),
-
-        spacing="3",
-        align_items="start",
-        width="100%",
-    )
-
 _formatting_note_timeline = {
-    "padding_left": "1em",
+    "position": "relative",
+    "padding_left": "1.5em",
     "border_left": f"2px solid {rx.color('gray', 6)}",
     "padding_bottom": "1.5em",
     "margin_left": "5px",
+    "width": "100%",
+
+    # 🔵 Timeline bullet drawn in CSS, centered on the left border (no extra DOM nodes)
+    "&::before": {
+        "content": "''",
+        "position": "absolute",
+        "left": "-7px",
+        "top": "2px",
+        "width": "12px",
+        "height": "12px",
+        "border_radius": "50%",
+        "bg": rx.color("brown", 9),
+    },
 }
 
 def timeline(note: Dict) -> rx.Component:
     """
     🗓️ Renders a complete timeline item (single note entry).
-    Visual: Vertical line on left edge | [🔵] timestamp + note content
-    Structure: Outer box with left border + padding, containing the full item layout.
+    Visual: Vertical line on left edge with a 🔵 bullet | timestamp + note content
+    Structure: One box (left border + CSS ::before bullet) containing the two text nodes.
     """
 
     return rx.box(
 
-        _timeline_item_layout(note),
+        _timeline_timestamp(note),
+
+        _timeline_note_content(note),
 
         **_formatting_note_timeline
-    )
\ No newline at end of file
+    )
+
+@rx.memo
+def timeline_memo(note: rx.Var[Dict]) -> rx.Component:
+    """
+    🧠 Memoized wrapper around timeline() for use in rx.foreach.
+    Visual: Same timeline item as timeline(); React skips re-rendering notes whose note prop is unchanged.
+    """
+    return timeline(note)
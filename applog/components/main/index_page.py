@@ -69,10 +69,14 @@ def _main_page_add_button() -> rx.Component:
 def _main_page_total_applications_display(state: rx.State) -> rx.Component:
     """
     🔢 Renders the total applications counter.
-    Visual: "Applications: 42" (small gray text showing count)
+    Visual: "Showing 12 out of 42 applications" (small gray text showing counts)
     """
     return rx.text(
-        f"Showing {state.filtered_jobs_count} out of {state.total_jobs_count} applications",
+        "Showing ",
+        state.filtered_jobs_count,
+        " out of ",
+        state.total_jobs_count,
+        " applications",
         size="2",
         color=rx.color("gray", 10),
     )
@@ -97,6 +101,30 @@ def _main_page_templates_link() -> rx.Component:
         href="/templates",
     )
 
+@rx.memo
+def heading_memo() -> rx.Component:
+    """
+    🧠 Memoized static heading (takes no props, so React never re-renders it).
+    Visual: [AppLog (large heading)]
+            [Track your job applications (subtext)]
+    """
+    return _main_page_heading()
+
+@rx.memo
+def links_memo() -> rx.Component:
+    """
+    🧠 Memoized static navigation buttons (takes no props, so React never re-renders them).
+    Visual: [Templates] [+ Add Job]
+    """
+    return rx.hstack(
+
+        _main_page_templates_link(),
+
+        _main_page_add_button(),
+
+        spacing="3",
+    )
+
 _formatting_main_page_and_add_job_button = {
     "width": "100%",
     "align_items": "center",
@@ -111,19 +139,12 @@ def _render_heading(state: rx.State) -> rx.Component:
                                                        [Applications: 42]
     """
     return rx.hstack(
-                _main_page_heading(),
+                heading_memo(),
 
                 rx.spacer(),
 
                 rx.vstack(
-                    rx.hstack(
-
-                        _main_page_templates_link(),
-
-                        _main_page_add_button(),
-
-                        spacing="3",
-                    ),
+                    links_memo(),
 
                     _main_page_total_applications_display(state),
 
@@ -1,10 +1,10 @@
 """Shared/reusable components."""
 
-# Import modules for module.function access (formatters.format_date, sidebar.sb_filter)
-from . import formatters, sidebar
+# Import modules for module.function access (formatters.format_date, sidebar.sb_filter, options.STATUS_OPTIONS)
+from . import formatters, options, sidebar
 
 # Import functions directly for direct calling (search_bar(State), status_badge(status))
 from .search_bar import search_bar
 from .status_badge import status_badge
 
-__all__ = ['search_bar', 'status_badge', 'sidebar', 'formatters']
+__all__ = ['search_bar', 'status_badge', 'sidebar', 'formatters', 'options']
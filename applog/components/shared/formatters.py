@@ -1,14 +1,60 @@
+from datetime import datetime
+
+
+def _format_iso_date(str_date: str) -> str:
+    """Parse an ISO date string and render it as DD/MM/YYYY.
+
+    Not cached: application dates are full datetimes, so a cache would only pin strings.
+    """
+    if str_date in ("", "None", "null"):
+        return ""
+
+    # Fast path: ISO 8601 (what the models emit) has fixed offsets, so slice instead of parsing
+    if len(str_date) >= 10 and str_date[4] == "-" and str_date[7] == "-":
+        return f"{str_date[8:10]}/{str_date[5:7]}/{str_date[0:4]}"
+
+    try:
+        return datetime.fromisoformat(str_date).strftime("%d/%m/%Y")
+    except ValueError:
+        return ""
 
 def format_date(iso_date_str) -> str:
     """Format ISO date string to DD/MM/YYYY. Works with both strings and Reflex Vars."""
     try:
-        from datetime import datetime
-        # Convert to string immediately - no conditionals on Var parameter
-        str_date = str(iso_date_str)
-        # Now check the string value
-        if str_date in ("", "None", "null"):
-            return ""
-        dt = datetime.fromisoformat(str_date)
-        return dt.strftime("%d/%m/%Y")
+        # Plain strings (the DB path) skip the conversion; anything else, e.g. a Var, goes through str()
+        str_date = iso_date_str if type(iso_date_str) is str else str(iso_date_str)
+        return _format_iso_date(str_date)
+    except (ValueError, AttributeError, TypeError):
+        return ""
+
+
+def _format_iso_datetime(str_datetime: str) -> str:
+    """Parse an ISO datetime string and render it as DD/MM/YYYY HH:MM.
+
+    Not cached: note timestamps are microsecond-unique, so a cache would only pin strings.
+    """
+    if str_datetime in ("", "None", "null"):
+        return ""
+
+    # Fast path: "YYYY-MM-DDTHH:MM..." has fixed offsets, so slice instead of parsing
+    if (
+        len(str_datetime) >= 16
+        and str_datetime[4] == "-"
+        and str_datetime[7] == "-"
+        and str_datetime[10] in "T "
+        and str_datetime[13] == ":"
+    ):
+        return f"{str_datetime[8:10]}/{str_datetime[5:7]}/{str_datetime[0:4]} {str_datetime[11:16]}"
+
+    try:
+        return datetime.fromisoformat(str_datetime).strftime("%d/%m/%Y %H:%M")
+    except ValueError:
+        return ""
+
+def format_datetime(iso_datetime_str) -> str:
+    """Format ISO datetime string to DD/MM/YYYY HH:MM (e.g. note timestamps)."""
+    try:
+        str_datetime = iso_datetime_str if type(iso_datetime_str) is str else str(iso_datetime_str)
+        return _format_iso_datetime(str_datetime)
     except (ValueError, AttributeError, TypeError):
-        return ""
\ No newline at end of file
+        return ""
@@ -0,0 +1,6 @@
+"""Shared select options."""
+
+from applog.models.job_application import ApplicationStatus
+
+# Status dropdown values, in ApplicationStatus order (single source for the add-job and detail forms)
+STATUS_OPTIONS = [status.value for status in ApplicationStatus]
@@ -1,11 +1,14 @@
 import reflex as rx
 
 def search_bar(state: rx.State) -> rx.Component:
-    """Search bar component."""
-    return rx.input(
-        placeholder="Search by company or job title...",
-        value=state.search_query,
-        on_change=state.set_search_query,
-        width="100%",
-        size="3",
-    )
\ No newline at end of file
+    """Search bar component. Keystrokes are debounced so a typing burst triggers a single filter pass."""
+    return rx.debounce_input(
+        rx.input(
+            placeholder="Search by company or job title...",
+            value=state.search_query,
+            on_change=state.set_search_query,
+            width="100%",
+            size="3",
+        ),
+        debounce_timeout=150,
+    )
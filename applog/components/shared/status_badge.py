@@ -1,15 +1,20 @@
 import reflex as rx
 
-def status_badge(status: str) -> rx.Component:
-    """Create a status badge with appropriate styling."""
-    color_map = {
-        "Applied": "blue",
-        "Screening": "purple",
-        "Interview": "yellow",
-        "Offer": "green",
-        "Accepted": "grass",
-        "Rejected": "red",
-        "Withdrawn": "gray",
-        "No Response": "orange",
-    }
-    return rx.badge(status, color_scheme=color_map.get(status, "gray"))
+_STATUS_COLORS = {
+    "Applied": "blue",
+    "Screening": "purple",
+    "Interview": "yellow",
+    "Offer": "green",
+    "Accepted": "grass",
+    "Rejected": "red",
+    "Withdrawn": "gray",
+    "No Response": "orange",
+}
+
+def status_badge(status: rx.Var[str]) -> rx.Component:
+    """Create a status badge with appropriate styling.
+
+    The status is a Var (a job field), so the color is picked client-side with rx.match;
+    a Python dict lookup would run once at compile time and never match.
+    """
+    return rx.badge(status, color_scheme=rx.match(status, *_STATUS_COLORS.items(), "gray"))
@@ -32,13 +32,16 @@ def _search_bar_input(state: rx.State) -> rx.Component:
     🔍 Renders the template search input field.
     Visual: Search box with placeholder "Search templates by name or content..."
     """
-    return rx.input(
-                placeholder="Search templates by name or content...",
-                value=state.template_search_query,
-                on_change=state.set_template_search_query,
-                width="100%",
-                size="3",
-                margin_bottom="1em",
+    return rx.debounce_input(
+                rx.input(
+                    placeholder="Search templates by name or content...",
+                    value=state.template_search_query,
+                    on_change=state.set_template_search_query,
+                    width="100%",
+                    size="3",
+                    margin_bottom="1em",
+                ),
+                debounce_timeout=150,
             )
 
 def _message_display(state: rx.State) -> rx.Component:
@@ -48,31 +51,15 @@ def _message_display(state: rx.State) -> rx.Component:
     """
     return rx.cond(
 
-        # Cond 1: If this is true
+        # If this is true
         state.form_message,
 
-        # Cond 1: Run this
-        # Cond 2: Declaration
-        rx.cond(
-
-            # Cond 2: If this is true
-            state.form_message_type == "success",
-
-            # Cond 2: Run this
-            rx.callout(
-                state.form_message,
-                icon="info",
-                color_scheme="green",
-                size="2",
-            ),
-
-            # Cond 2: Otherwise run this
-            rx.callout(
-                state.form_message,
-                icon="alert-triangle",
-                color_scheme="red",
-                size="2",
-            ),
+        # Run this: one callout, colored and iconed by the message type
+        rx.callout(
+            state.form_message,
+            icon=state.form_message_icon,
+            color_scheme=state.form_message_color,
+            size="2",
         ),
     )
 
@@ -119,29 +106,35 @@ _formatting_template_form_heading = {
 
 def _template_name_input(state: rx.State) -> rx.Component:
     """
-    📝 Renders the template name input field.
+    📝 Renders the template name input field (debounced: one state update per typing pause).
     Visual: Text input for template name (e.g., "Cover Letter Sent")
     """
-    return rx.input(
-        placeholder="e.g., Cover Letter Sent, Phone Screen Completed",
-        value=state.form_template_name,
-        on_change=state.set_form_template_name,
-        width="100%",
-        size="3",
+    return rx.debounce_input(
+        rx.input(
+            placeholder="e.g., Cover Letter Sent, Phone Screen Completed",
+            value=state.form_template_name,
+            on_change=state.set_form_template_name,
+            width="100%",
+            size="3",
+        ),
+        debounce_timeout=250,
     )
 
 def _template_content_text_area(state: rx.State) -> rx.Component:
     """
-    📄 Renders the template content textarea.
+    📄 Renders the template content textarea (debounced: one state update per typing pause).
     Visual: Multi-line text area for template content (vertically resizable)
     """
-    return rx.text_area(
-        placeholder="The note text that will be inserted...",
-        value=state.form_template_content,
-        on_change=state.set_form_template_content,
-        width="100%",
-        min_height="100px",
-        resize="vertical",
+    return rx.debounce_input(
+        rx.text_area(
+            placeholder="The note text that will be inserted...",
+            value=state.form_template_content,
+            on_change=state.set_form_template_content,
+            width="100%",
+            min_height="100px",
+            resize="vertical",
+        ),
+        debounce_timeout=250,
     )
 
 _formatting_template_form_card_vstack = {
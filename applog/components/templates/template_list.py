@@ -11,9 +11,7 @@ def _templates_list_edit_button(state: rx.State, template) -> rx.Component:
         "Edit",
         size="1",
         variant="soft",
-        on_click=lambda: state.handle_edit_template(
-            template["id"]
-        ),
+        on_click=state.handle_edit_template(template["id"]),
     )
 
 def _templates_list_delete_button(state: rx.State, template) -> rx.Component:
@@ -26,14 +24,7 @@ def _templates_list_delete_button(state: rx.State, template) -> rx.Component:
         size="1",
         variant="soft",
         color_scheme="red",
-        on_click=lambda: [
-            state.set_selected_template_id(
-                template["id"]
-            ),
-            state.set_show_delete_template_dialog(
-                True
-            ),
-        ],
+        on_click=state.open_delete_template_dialog(template["id"]),
     )
 
 _formatting_templates_list_hstack = {
@@ -138,6 +129,18 @@ def _templates_list_no_templates_found_text() -> rx.Component:
         font_style="italic",
     )
 
+@rx.memo
+def template_content_memo(content: rx.Var[str]) -> rx.Component:
+    """
+    🧠 Memoized template content text (the largest, purely presentational part of a template card).
+    Visual: Gray body text of the template; React skips re-rendering it while the content is unchanged.
+    """
+    return rx.text(
+        content,
+        size="2",
+        color=rx.color("gray", 11),
+    )
+
 def _templates_list_display_templates_lambda_function(state: rx.State):
     """
     📋 Returns a lambda function for rendering individual template items.
@@ -167,11 +170,7 @@ def _templates_list_display_templates_lambda_function(state: rx.State):
                 **_formatting_templates_list_hstack
             ),
 
-            rx.text(
-                template["content"],
-                size="2",
-                color=rx.color("gray", 11),
-            ),
+            template_content_memo(content=template["content"]),
 
             **_formatting_templates_list_vstack
         ),
@@ -179,10 +178,25 @@ def _templates_list_display_templates_lambda_function(state: rx.State):
         **_formatting_templates_list_box
     )
 
+def _templates_list_show_more_button(state: rx.State):
+    """
+    ⏬ Conditionally renders the button revealing more templates.
+    Visual: Soft "Show more templates" button below the list (only shown if templates are hidden)
+    """
+    return rx.cond(
+        state.has_more_templates,
+        rx.button(
+            "Show more templates",
+            size="2",
+            variant="soft",
+            on_click=state.show_more_templates,
+        ),
+    )
+
 def _filter_templates_conditional(state: rx.State):
     """
     🔍 Renders the templates list or empty state conditionally.
-    Visual: If templates exist, shows list of template cards.
+    Visual: If templates exist, shows the visible window of template cards + "Show more templates" button.
             If no templates, shows "No templates found" message.
     """
     return rx.cond(
@@ -197,12 +211,14 @@ def _filter_templates_conditional(state: rx.State):
             rx.foreach(
 
                 # Iterable
-                state.filtered_templates,
+                state.visible_templates,
 
                 # Lambda function
                 _templates_list_display_templates_lambda_function(state),
             ),
 
+            _templates_list_show_more_button(state),
+
             **_formatting_templates_list_display
         ),
 
@@ -1,5 +1,6 @@
 """Database configuration and session management."""
 
+from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from pathlib import Path
@@ -14,6 +15,7 @@ engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Needed for SQLite
     echo=False,  # Set to True for SQL query logging during development
+    pool_pre_ping=True,  # Check pooled connections before handing them out
 )
 
 # Create session factory
@@ -32,6 +34,25 @@ def get_db():
         db.close()
 
 
+@contextmanager
+def session_scope():
+    """Provide a transactional session: commits on success, rolls back on error, always closes."""
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
+
+    # create_all() skips existing tables, so add any index declared after the table was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
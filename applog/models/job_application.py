@@ -37,7 +37,7 @@ class JobApplication(Base):
         nullable=False,
         index=True,
     )
-    application_date = Column(DateTime, default=datetime.now, nullable=False)
+    application_date = Column(DateTime, default=datetime.now, nullable=False, index=True)
     salary_range = Column(String(100))
     notes = Column(JSON, default=list)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
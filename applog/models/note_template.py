@@ -5,6 +5,9 @@ from datetime import datetime
 from sqlalchemy import Column, Integer, String, Text, DateTime
 from applog.database import Base
 
+# Max characters of template content sent for hover previews (quick-insert tooltips)
+PREVIEW_LENGTH = 80
+
 
 class NoteTemplate(Base):
     """Note template model for storing reusable note templates."""
@@ -28,6 +31,14 @@ class NoteTemplate(Base):
             "id": self.id,
             "name": self.name,
             "content": self.content,
+            "content_preview": self._preview(self.content),
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+    def _preview(self, content):
+        """Shorten content to PREVIEW_LENGTH characters, marking the cut with an ellipsis."""
+        if not content or len(content) <= PREVIEW_LENGTH:
+            return content or ""
+
+        return content[:PREVIEW_LENGTH].rstrip() + "…"
@@ -165,6 +165,18 @@ def get_job_by_url(session: Session, job_url: str) -> JobApplication | None:
         return None
 
 
+def get_all_jobs(session: Session) -> list[JobApplication]:
+    """Retrieve all job applications, most recent application first.
+
+    Args:
+        session: SQLAlchemy database session.
+
+    Returns:
+        List of all JobApplication objects ordered by application_date descending.
+    """
+    return session.query(JobApplication).order_by(JobApplication.application_date.desc()).all()
+
+
 def update_job(
     session: Session, job_id: int, job_updates: dict
 ) -> JobApplication | None:
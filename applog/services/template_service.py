@@ -3,6 +3,25 @@
 from sqlalchemy.orm import Session
 from applog.models.note_template import NoteTemplate
 
+# Bumped after every committed template write in this process, so callers holding a
+# loaded copy of the templates can tell whether it is stale (see get_templates_generation)
+_templates_generation = 0
+
+
+def _bump_templates_generation() -> None:
+    """Mark every loaded copy of the templates as stale."""
+    global _templates_generation
+    _templates_generation += 1
+
+
+def get_templates_generation() -> int:
+    """Get the current templates generation.
+
+    Returns:
+        A counter that changes whenever a template is created, updated or deleted.
+    """
+    return _templates_generation
+
 
 def validate_template_fields(template_data: dict) -> None:
     """Validate that dictionary is not empty and all field names exist in NoteTemplate model.
@@ -52,6 +71,7 @@ def create_template(session: Session, template_data: dict) -> NoteTemplate:
         session.rollback()
         raise
 
+    _bump_templates_generation()
     return template
 
 
@@ -138,6 +158,7 @@ def update_template(
         session.rollback()
         raise
 
+    _bump_templates_generation()
     return existing_template
 
 
@@ -163,4 +184,5 @@ def delete_template(session: Session, template_id: int) -> bool:
         session.rollback()
         raise
 
+    _bump_templates_generation()
     return True
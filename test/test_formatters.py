@@ -0,0 +1,56 @@
+"""Unit tests for the date/datetime formatters."""
+
+import pytest
+from applog.components.shared.formatters import format_date, format_datetime
+
+
+class TestFormatDate:
+    """Tests for format_date function."""
+
+    def test_format_date_iso_date(self):
+        """Test that an ISO date is rendered as DD/MM/YYYY."""
+        assert format_date("2025-03-04") == "04/03/2025"
+
+    def test_format_date_iso_datetime_keeps_date_part(self):
+        """Test that a full ISO datetime (T or space separator) only keeps the date."""
+        assert format_date("2025-03-04T10:15:30.123456") == "04/03/2025"
+        assert format_date("2025-03-04 10:15:30") == "04/03/2025"
+
+    def test_format_date_compact_date_uses_fallback(self):
+        """Test that a compact ISO date (no dashes) is parsed by the fromisoformat fallback."""
+        assert format_date("20250304") == "04/03/2025"
+
+    @pytest.mark.parametrize("value", ["", "None", "null", None])
+    def test_format_date_empty_values_return_empty_string(self, value):
+        """Test that empty and null-like values render as an empty string."""
+        assert format_date(value) == ""
+
+    def test_format_date_invalid_string_returns_empty_string(self):
+        """Test that a non-date string renders as an empty string."""
+        assert format_date("not a date") == ""
+
+
+class TestFormatDatetime:
+    """Tests for format_datetime function."""
+
+    def test_format_datetime_t_separator(self):
+        """Test that an ISO datetime with a T separator is rendered as DD/MM/YYYY HH:MM."""
+        assert format_datetime("2025-03-04T10:15:30.123456") == "04/03/2025 10:15"
+
+    def test_format_datetime_space_separator(self):
+        """Test that an ISO datetime with a space separator is rendered as DD/MM/YYYY HH:MM."""
+        assert format_datetime("2025-03-04 10:15:30") == "04/03/2025 10:15"
+
+    def test_format_datetime_compact_uses_fallback(self):
+        """Test that a compact ISO date (no dashes) is parsed by the fromisoformat fallback."""
+        assert format_datetime("20250304") == "04/03/2025 00:00"
+        assert format_datetime("20250304T101530") == "04/03/2025 10:15"
+
+    @pytest.mark.parametrize("value", ["", "None", "null", None])
+    def test_format_datetime_empty_values_return_empty_string(self, value):
+        """Test that empty and null-like values render as an empty string."""
+        assert format_datetime(value) == ""
+
+    def test_format_datetime_invalid_string_returns_empty_string(self):
+        """Test that a non-datetime string renders as an empty string."""
+        assert format_datetime("not a date") == ""
@@ -6,7 +6,8 @@ from applog.services.job_service import (
     get_job_by_url,
     update_job,
     delete_job,
-    add_note
+    add_note,
+    get_all_jobs,
 )
 from applog.database import Base
 from applog.models.job_application import JobApplication, ApplicationStatus
@@ -198,6 +199,43 @@ class TestRead:
 
 
 
+class TestGetAll:
+
+    @pytest.fixture
+    def seeded_jobs(self, db_session: Session) -> list[JobApplication]:
+        jobs = [
+            {
+                "company_name": "Imerys",
+                "job_title": "Project Manager",
+                "job_url": "https://example.com/job/1",
+                "location": "Geneva",
+                "status": ApplicationStatus.APPLIED,
+                "application_date": datetime(2025, 10, 1),
+            },
+            {
+                "company_name": "Nestle",
+                "job_title": "Python Developer",
+                "job_url": "https://example.com/job/2",
+                "location": "Lausanne",
+                "status": ApplicationStatus.INTERVIEW,
+                "application_date": datetime(2025, 10, 3),
+            },
+            {
+                "company_name": "Logitech",
+                "job_title": "Senior Python Engineer",
+                "job_url": "https://example.com/job/3",
+                "location": "Lausanne",
+                "status": ApplicationStatus.REJECTED,
+                "application_date": datetime(2025, 10, 2),
+            },
+        ]
+        return [create_job(db_session, job) for job in jobs]
+
+    def test_get_all_jobs_ordered_by_application_date_desc(self, db_session: Session, seeded_jobs: list) -> None:
+        result = get_all_jobs(db_session)
+        assert [job.company_name for job in result] == ["Nestle", "Logitech", "Imerys"]
+
+
 class TestUpdate:
 
     def test_update_job_modifies_fields(
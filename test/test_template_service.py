@@ -4,11 +4,12 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from applog.database import Base
-from applog.models.note_template import NoteTemplate
+from applog.models.note_template import NoteTemplate, PREVIEW_LENGTH
 from applog.services.template_service import (
     create_template,
     get_template_by_id,
     get_all_templates,
+    get_templates_generation,
     search_templates,
     update_template,
     delete_template,
@@ -99,6 +100,17 @@ class TestReadTemplate:
         assert result.id == template.id
         assert result.name == "Phone Screen"
 
+    def test_to_dict_content_preview_truncates_long_content(self, db_session):
+        """Test that to_dict exposes a short content preview for tooltips."""
+        short = NoteTemplate(name="Short", content="Thanks for your time.")
+        long = NoteTemplate(name="Long", content="x" * (PREVIEW_LENGTH + 20))
+        db_session.add_all([short, long])
+        db_session.commit()
+
+        assert short.to_dict()["content_preview"] == "Thanks for your time."
+        assert long.to_dict()["content_preview"] == "x" * PREVIEW_LENGTH + "…"
+        assert long.to_dict()["content"] == "x" * (PREVIEW_LENGTH + 20)
+
     def test_get_template_by_id_returns_none_when_not_found(self, db_session):
         """Test that non-existent ID returns None."""
         result = get_template_by_id(db_session, 999)
@@ -230,3 +242,30 @@ class TestDeleteTemplate:
         """Test deleting non-existent template returns False."""
         result = delete_template(db_session, 999)
         assert result is False
+
+
+class TestTemplatesGeneration:
+    """Tests for the templates generation counter."""
+
+    def test_writes_bump_generation(self, db_session):
+        """Test that create, update and delete each change the generation."""
+        generation = get_templates_generation()
+        template = create_template(db_session, {"name": "Test", "content": "Test content"})
+        assert get_templates_generation() != generation
+
+        generation = get_templates_generation()
+        update_template(db_session, template.id, {"name": "New Name"})
+        assert get_templates_generation() != generation
+
+        generation = get_templates_generation()
+        delete_template(db_session, template.id)
+        assert get_templates_generation() != generation
+
+    def test_noop_writes_keep_generation(self, db_session):
+        """Test that updating or deleting a non-existent template leaves the generation unchanged."""
+        generation = get_templates_generation()
+
+        update_template(db_session, 999, {"name": "Test"})
+        delete_template(db_session, 999)
+
+        assert get_templates_generation() == generation